@@ -1,6 +1,7 @@
 """
     Functions for various anti-aliasing functions and wrappers.
 """
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
 
 import vapoursynth as vs
@@ -12,6 +13,16 @@ from .util import scale_thresh
 core = vs.core
 
 
+@lru_cache
+def _has_expr_clamp() -> bool:
+    # Not every akarin build ships the clamp operator, so probe for it once
+    try:
+        core.akarin.Expr(core.std.BlankClip(format=vs.GRAY8, width=1, height=1, length=1), "x 0 1 clamp")
+    except (AttributeError, vs.Error):
+        return False
+    return True
+
+
 def clamp_aa(src: vs.VideoNode, weak: vs.VideoNode, strong: vs.VideoNode, strength: float = 1) -> vs.VideoNode:
     """
     Clamp stronger AAs to weaker AAs.
@@ -19,6 +30,9 @@ def clamp_aa(src: vs.VideoNode, weak: vs.VideoNode, strong: vs.VideoNode, streng
 
     Stolen from Zastin.
 
+    Dependencies:
+    * akarin (optional: faster Expr)
+
     :param src:      Non-AA'd source clip.
     :param weak:     Weakly-AA'd clip (eg: nnedi3)
     :param strong:   Strongly-AA'd clip (eg: eedi3)
@@ -30,11 +44,16 @@ def clamp_aa(src: vs.VideoNode, weak: vs.VideoNode, strong: vs.VideoNode, streng
         raise ValueError("clamp_aa: 'Variable-format clips not supported'")
     thr = strength * (1 << (src.format.bits_per_sample - 8)) if src.format.sample_type == vs.INTEGER \
         else strength/219
-    clamp = core.std.Expr([get_y(src), get_y(weak), get_y(strong)],
-                          expr=f"x y - x z - xor x x y - abs x z - abs < z y {thr} + min y {thr} - max z ? ?"
-                          if thr != 0 else "x y z min max y z max min")
-    return clamp if src.format.color_family == vs.GRAY \
-        else core.std.ShufflePlanes([clamp, src], planes=[0, 1, 2], colorfamily=vs.YUV)
+
+    if thr == 0:
+        expr = "x y z min max y z max min"
+    elif _has_expr_clamp():
+        expr = f"x y - x z - xor x x y - abs x z - abs < z y {thr} - y {thr} + clamp z ? ?"
+    else:
+        expr = f"x y - x z - xor x x y - abs x z - abs < z y {thr} + min y {thr} - max z ? ?"
+
+    clamp = util.pick_expr()([get_y(src), get_y(weak), get_y(strong)], expr=expr)
+    return util.merge_chroma(clamp, src)
 
 
 def taa(clip: vs.VideoNode, aafun: Callable[[vs.VideoNode], vs.VideoNode]) -> vs.VideoNode:
@@ -57,8 +76,7 @@ def taa(clip: vs.VideoNode, aafun: Callable[[vs.VideoNode], vs.VideoNode]) -> vs
     aa = aafun(aa)
     aa = aa.resize.Spline36(height=clip.height, src_top=0.5)
 
-    return aa if clip.format.color_family == vs.GRAY \
-        else core.std.ShufflePlanes([aa, clip], planes=[0, 1, 2], colorfamily=vs.YUV)
+    return util.merge_chroma(aa, clip)
 
 
 def nnedi3(opencl: bool = False, **override: Any) -> Callable[[vs.VideoNode], vs.VideoNode]:
@@ -112,6 +130,7 @@ def kirsch_aa_mask(clip: vs.VideoNode, mthr: float = 0.25) -> vs.VideoNode:
 
     Dependencies:
     * kagefunc
+    * akarin (optional: fuses binarizing and expanding into a single pass)
 
     :param clip: Input clip
     :param mthr: Mask threshold, scaled to clip range if between 0 and 1 (inclusive).
@@ -122,7 +141,19 @@ def kirsch_aa_mask(clip: vs.VideoNode, mthr: float = 0.25) -> vs.VideoNode:
     except ModuleNotFoundError:
         raise ModuleNotFoundError("kirsch_aa_mask: missing dependency 'kagefunc'")
 
-    return kirsch(get_y(clip)).std.Binarize(scale_thresh(mthr, clip)).std.Maximum().std.Convolution([1] * 9)
+    mask = kirsch(get_y(clip))
+    thr = scale_thresh(mthr, clip)
+
+    if hasattr(core, 'akarin'):
+        assert mask.format is not None
+        # Binarizing the 3x3 maximum equals the 3x3 maximum of the binarized clip, but only reads the clip once
+        peak = 1 if mask.format.sample_type == vs.FLOAT else (1 << mask.format.bits_per_sample) - 1
+        window = ' '.join(f'x[{x},{y}]' for y in (-1, 0, 1) for x in (-1, 0, 1))
+        mask = core.akarin.Expr(mask, f"{window} {'max ' * 8}{thr} >= {peak} 0 ?")
+    else:
+        mask = mask.std.Binarize(thr).std.Maximum()
+
+    return mask.std.Convolution([1] * 9)
 
 
 def nneedi3_clamp(clip: vs.VideoNode, strength: float = 1,
@@ -148,7 +179,35 @@ def nneedi3_clamp(clip: vs.VideoNode, strength: float = 1,
     y = get_y(clip)
     merged = core.std.MaskedMerge(y, clamp_aa(y, taa(y, nnedi3(opencl=opencl)), taa(y, eedi3(opencl=opencl)), strength),
                                   mask or kirsch_aa_mask(y))
-    return merged if clip.format.color_family == vs.GRAY else core.std.ShufflePlanes([merged, clip], [0, 1, 2], vs.YUV)
+    return util.merge_chroma(merged, clip)
+
+
+def _transpose_aa_nnedi3(clip: vs.VideoNode) -> vs.VideoNode:
+    return clip.nnedi3.nnedi3(0, 1, 0, 3, 3, 2).nnedi3.nnedi3(1, 0, 0, 3, 3, 2)
+
+
+def _transpose_aa_eedi3(clip: vs.VideoNode) -> vs.VideoNode:
+    return clip.eedi3m.EEDI3(0, 1, 0, 0.5, 0.2).znedi3.nnedi3(1, 0, 0, 3, 4, 2)
+
+
+def _transpose_aa_taa(clip: vs.VideoNode, aafun: Callable[[vs.VideoNode], vs.VideoNode]) -> vs.VideoNode:
+    aa = aafun(clip.std.Transpose())
+    aa = aa.resize.Bicubic(clip.height, clip.width, src_top=.5).std.Transpose()
+    aa = aafun(aa)
+    return aa.resize.Bicubic(clip.width, clip.height, src_top=.5)
+
+
+def _transpose_aa_csharp(flt: vs.VideoNode, clip: vs.VideoNode) -> vs.VideoNode:
+    if hasattr(core, 'akarin'):
+        # Compute the 3x3 blur in place instead of writing and re-reading a separate blurred clip,
+        # rounding it for integer formats the same way std.Convolution does
+        assert flt.format is not None
+        window = ' '.join(f'x[{x},{y}]:m' for y in (-1, 0, 1) for x in (-1, 0, 1))
+        rnd = '0.5 + floor ' if flt.format.sample_type == vs.INTEGER else ''
+        return core.akarin.Expr([flt, clip], f'{window} {"+ " * 8}9 / {rnd}blur! '
+                                'x y < x x + blur@ - x max y min x x + blur@ - x min y max ?')
+    blur = core.std.Convolution(flt, [1] * 9)
+    return core.std.Expr([flt, clip, blur], 'x y < x x + z - x max y min x x + z - x min y max ?')
 
 
 def transpose_aa(clip: vs.VideoNode,
@@ -162,6 +221,7 @@ def transpose_aa(clip: vs.VideoNode,
     Original function written by Zastin, modified by LightArrowsEXE.
 
     Dependencies:
+    * akarin (optional: faster contra-sharpening)
     * RGSF (optional: 32 bit clip)
     * vapoursynth-EEDI3
     * vapoursynth-nnedi3
@@ -178,25 +238,13 @@ def transpose_aa(clip: vs.VideoNode,
 
     clip_y = get_y(clip)
 
-    def _aafun(clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.eedi3m.EEDI3(0, 1, 0, 0.5, 0.2).znedi3.nnedi3(1, 0, 0, 3, 4, 2) if eedi3 \
-            else clip.nnedi3.nnedi3(0, 1, 0, 3, 3, 2).nnedi3.nnedi3(1, 0, 0, 3, 3, 2)
-
-    def _taa(clip: vs.VideoNode) -> vs.VideoNode:
-        aa = _aafun(clip.std.Transpose())
-        aa = aa.resize.Bicubic(clip.height, clip.width, src_top=.5).std.Transpose()
-        aa = _aafun(aa)
-        return aa.resize.Bicubic(clip.width, clip.height, src_top=.5)
-
-    def _csharp(flt: vs.VideoNode, clip: vs.VideoNode) -> vs.VideoNode:
-        blur = core.std.Convolution(flt, [1] * 9)
-        return core.std.Expr([flt, clip, blur], 'x y < x x + z - x max y min x x + z - x min y max ?')
+    aafun = _transpose_aa_eedi3 if eedi3 else _transpose_aa_nnedi3
 
-    aaclip = _taa(clip_y)
-    aaclip = _csharp(aaclip, clip_y)
+    aaclip = _transpose_aa_taa(clip_y, aafun)
+    aaclip = _transpose_aa_csharp(aaclip, clip_y)
     aaclip = util.pick_repair(clip_y)(aaclip, clip_y, rep)
 
-    return aaclip if clip.format.color_family is vs.GRAY else core.std.ShufflePlanes([aaclip, clip], [0, 1, 2], vs.YUV)
+    return util.merge_chroma(aaclip, clip)
 
 
 def _nnedi3_supersample(clip: vs.VideoNode, width: int, height: int, opencl: bool = False) -> vs.VideoNode:
@@ -17,7 +17,7 @@ import vsutil
 from .dehardsub import hardsub_mask
 from .progress import Progress, BarColumn, FPSColumn, TextColumn, TimeRemainingColumn
 from .render import clip_async_render
-from .util import get_prop
+from .util import get_prop, select_frames
 from .misc import get_matrix
 
 core = vs.core
@@ -359,6 +359,8 @@ def compare(clip_a: vs.VideoNode, clip_b: vs.VideoNode,
     """
     def _resample(clip: vs.VideoNode) -> vs.VideoNode:
         # Resampling to 8 bit and RGB to properly display how it appears on your screen
+        if clip.format is not None and clip.format.id == vs.RGB24:
+            return clip
         return core.resize.Bicubic(clip, format=vs.RGB24, matrix_in=get_matrix(clip),
                                    prefer_props=True, dither_type='error_diffusion')
 
@@ -374,6 +376,11 @@ def compare(clip_a: vs.VideoNode, clip_b: vs.VideoNode,
         if clip_a.format.id != clip_b.format.id:
             raise ValueError("compare: 'The format of both clips must be equal'")
 
+    # A single FrameEval can only serve clips that share a constant format and size
+    matching = clip_a.format is not None and clip_b.format is not None \
+        and clip_a.format.id == clip_b.format.id and clip_a.width != 0 \
+        and (clip_a.width, clip_a.height) == (clip_b.width, clip_b.height)
+
     if print_frame:
         clip_a = clip_a.text.Text("Clip A").text.FrameNum(alignment=9)
         clip_b = clip_b.text.Text("Clip B").text.FrameNum(alignment=9)
@@ -384,9 +391,14 @@ def compare(clip_a: vs.VideoNode, clip_b: vs.VideoNode,
             rand_total = int(clip_a.num_frames / 1000) if clip_a.num_frames > 5000 else int(clip_a.num_frames / 100)
         frames = sorted(random.sample(range(1, clip_a.num_frames - 1), rand_total))
 
-    frames_a = core.std.Splice([clip_a[f] for f in frames]).std.AssumeFPS(fpsnum=1, fpsden=1)
-    frames_b = core.std.Splice([clip_b[f] for f in frames]).std.AssumeFPS(fpsnum=1, fpsden=1)
-    return core.std.Interleave([frames_a, frames_b], mismatch=mismatch)
+    if not matching:
+        frames_a = core.std.Splice([clip_a[f] for f in frames]).std.AssumeFPS(fpsnum=1, fpsden=1)
+        frames_b = core.std.Splice([clip_b[f] for f in frames]).std.AssumeFPS(fpsnum=1, fpsden=1)
+        return core.std.Interleave([frames_a, frames_b], mismatch=mismatch)
+
+    clips = [clip_a, clip_b]
+    indices = [(clip_idx, f) for f in frames for clip_idx in range(len(clips))]
+    return select_frames(clips, indices).std.AssumeFPS(fpsnum=len(clips), fpsden=1)
 
 
 def stack_compare(*clips: vs.VideoNode,
@@ -419,10 +431,14 @@ def stack_compare(*clips: vs.VideoNode,
     clipa, clipb = clips
     scaled_width = vsutil.get_w(height, only_even=False)
 
+    def _resize(clip: vs.VideoNode, width: int, height: int) -> vs.VideoNode:
+        return clip if (clip.width, clip.height) == (width, height) \
+            else clip.resize.Spline36(width=width, height=height)
+
     diff = core.std.MakeDiff(clipa=clipa, clipb=clipb)
-    diff = diff.resize.Spline36(width=scaled_width * 2, height=height * 2).text.FrameNum(8)
-    resized = [clipa.resize.Spline36(width=scaled_width, height=height).text.Text('Clip A', 3),
-               clipb.resize.Spline36(width=scaled_width, height=height).text.Text('Clip B', 1)]
+    diff = _resize(diff, scaled_width * 2, height * 2).text.FrameNum(8)
+    resized = [_resize(clipa, scaled_width, height).text.Text('Clip A', 3),
+               _resize(clipb, scaled_width, height).text.Text('Clip B', 1)]
 
     return Stack([Stack(resized).clip, diff], direction=Direction.VERTICAL).clip
 
@@ -539,11 +555,8 @@ def diff(*clips: vs.VideoNode,
         if any(nc.format is None for nc in namedclips.values()):
             raise ValueError("diff: variable-format namedclips not supported")
 
-    if clips:
-        a, b = vsutil.depth(clips[0], 8), vsutil.depth(clips[1], 8)
-    elif namedclips:
-        nc = list(namedclips.values())
-        a, b = vsutil.depth(nc[0], 8), vsutil.depth(nc[1], 8)
+    # vsutil.depth returns the clip untouched if it's already 8 bit
+    a, b = (vsutil.depth(c, 8) for c in (clips or tuple(namedclips.values())))
 
     progress = Progress(TextColumn("{task.description}"),
                         BarColumn(),
@@ -193,12 +193,12 @@ def dir_unsharp(clip: vs.VideoNode,
     Special thanks to thebombzen and kageru for writing the bulk of this.
 
     Dependencies:
-    * knlmeanscl
+    * knlmeanscl (or vs-nlm-cuda/vs-nlm-ispc, which are preferred if available)
 
     :param clip:            Input clip
     :param strength:        Amount to multiply blurred clip with original clip by (Default: 1.0)
     :param dir:             Directional vector. 'v' = Vertical, 'h' = Horizontal (Default: v)
-    :param h:               Sigma for knlmeans, to prevent noise from getting sharpened (Default: 3.4)
+    :param h:               Sigma for NLMeans, to prevent noise from getting sharpened (Default: 3.4)
 
     :return:                Unsharpened clip
     """
@@ -207,7 +207,7 @@ def dir_unsharp(clip: vs.VideoNode,
     if dir not in ['v', 'h']:
         raise ValueError("dir_unsharp: '\"dir\" must be either \"v\" or \"h\"'")
 
-    den = core.knlm.KNLMeansCL(clip, d=3, a=3, h=h)
+    den = util.pick_nlmeans(clip)(clip, d=3, a=3, h=h)
     diff = core.std.MakeDiff(clip, den)
 
     blur_matrix = [1, 2, 1]
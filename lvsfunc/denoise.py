@@ -1,7 +1,7 @@
 """
     Denoising functions.
 """
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 import vapoursynth as vs
 import vsutil
@@ -9,15 +9,29 @@ import vsutil
 core = vs.core
 
 
+def _pick_bm3d_fast() -> Optional[Callable[..., vs.VideoNode]]:
+    for namespace in ('bm3dcuda_rtc', 'bm3dcuda', 'bm3dcpu'):
+        if hasattr(core, namespace):
+            return cast(Callable[..., vs.VideoNode], getattr(core, namespace).BM3D)
+    return None
+
+
 def bm3d(clip: vs.VideoNode, sigma: Union[float, List[float]] = 0.75,
          radius: Union[int, List[int], None] = None, ref: Optional[vs.VideoNode] = None,
          pre: Optional[vs.VideoNode] = None, refine: int = 1, matrix_s: str = "709",
-         basic_args: Dict[str, Any] = {}, final_args: Dict[str, Any] = {}) -> vs.VideoNode:
+         basic_args: Dict[str, Any] = {}, final_args: Dict[str, Any] = {}, cuda: bool = False) -> vs.VideoNode:
     """
     A wrapper function for the BM3D denoiser.
 
+    With `cuda`, the estimations are run through VapourSynth-BM3DCUDA (bm3dcuda_rtc, bm3dcuda or bm3dcpu)
+    instead of VapourSynth-BM3D, as these are considerably faster.
+    VapourSynth-BM3D is still used for the color conversions and temporal aggregation.
+    Note that BM3DCUDA's defaults (block_step, group size, thresholds) differ from VapourSynth-BM3D's
+    Basic/Final profiles, so the output will not be identical.
+
     Dependencies:
     * VapourSynth-BM3D
+    * VapourSynth-BM3DCUDA (optional, for `cuda`)
 
     :param clip:            Input clip
     :param sigma:           Denoising strength for both basic and final estimations
@@ -29,8 +43,10 @@ def bm3d(clip: vs.VideoNode, sigma: Union[float, List[float]] = 0.75,
                             1 = basic + final estimation
                             n = basic + n final estimations
     :param matrix_s:        Color matrix of the input clip
-    :param basic_args:      Args to pass to the basic estimation
-    :param final_args:      Args to pass to the final estimation
+    :param basic_args:      Args to pass to VapourSynth-BM3D's basic estimation
+    :param final_args:      Args to pass to VapourSynth-BM3D's final estimation
+    :param cuda:            Use VapourSynth-BM3DCUDA for the estimations.
+                            Can't be combined with `pre`, `basic_args` or `final_args` (Default: False)
 
     :return:                Denoised clip
     """
@@ -59,7 +75,30 @@ def bm3d(clip: vs.VideoNode, sigma: Union[float, List[float]] = 0.75,
 
     pre = pre if pre is None else to_opp(pre) if not is_gray else to_fullgray(pre)
 
+    bm3d_fast = None
+    if cuda:
+        # BM3DCUDA shares neither VS-BM3D's extra args nor its prefiltered block-matching clip
+        if pre is not None or basic_args or final_args:
+            raise ValueError("bm3d: 'pre, basic_args and final_args are not supported with cuda'")
+        bm3d_fast = _pick_bm3d_fast()
+        if bm3d_fast is None:
+            raise ValueError("bm3d: 'cuda requires VapourSynth-BM3DCUDA (bm3dcuda_rtc, bm3dcuda or bm3dcpu)'")
+
+    # Like VS-BM3D, match blocks on the first OPP plane only and reuse them for the others.
+    # BM3DCUDA only does that for YUV444PS input, so the OPP planes are passed in as such.
+    def as_yuv(clip: vs.VideoNode) -> vs.VideoNode:
+        return clip if is_gray else core.std.ShufflePlanes(clip, planes=[0, 1, 2], colorfamily=vs.YUV)
+
+    def fast(clip: vs.VideoNode, radius: int, ref: Optional[vs.VideoNode] = None) -> vs.VideoNode:
+        assert bm3d_fast is not None
+        den = bm3d_fast(as_yuv(clip), ref=None if ref is None else as_yuv(ref),
+                        sigma=sigmal, radius=radius, chroma=not is_gray)
+        den = den if radius < 1 else den.bm3d.VAggregate(radius=radius, sample=1)
+        return den if is_gray else core.std.ShufflePlanes(den, planes=[0, 1, 2], colorfamily=vs.RGB)
+
     def basic(clip: vs.VideoNode) -> vs.VideoNode:
+        if bm3d_fast is not None:
+            return fast(clip, radiusl[0])
         return clip.bm3d.Basic(sigma=sigmal, ref=pre, matrix=100, **basic_args) if radiusl[0] < 1 \
             else clip.bm3d.VBasic(sigma=sigmal, ref=pre, radius=radiusl[0], matrix=100, **basic_args) \
             .bm3d.VAggregate(radius=radiusl[0], sample=1)
@@ -68,6 +107,8 @@ def bm3d(clip: vs.VideoNode, sigma: Union[float, List[float]] = 0.75,
     refv = basic(clip_in) if ref is None else to_opp(ref) if not is_gray else to_fullgray(ref)
 
     def final(clip: vs.VideoNode) -> vs.VideoNode:
+        if bm3d_fast is not None:
+            return fast(clip, radiusl[1], ref=refv)
         return clip.bm3d.Final(sigma=sigmal, ref=refv, matrix=100, **final_args) if radiusl[1] < 1 \
             else clip.bm3d.VFinal(sigma=sigmal, ref=refv, radius=radiusl[1], matrix=100, **final_args) \
             .bm3d.VAggregate(radius=radiusl[1], sample=1)
@@ -7,6 +7,8 @@ import random
 from functools import partial, wraps
 from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
                     TypeVar, Union, cast)
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 import vapoursynth as vs
 from vsutil import get_depth, get_w, get_y, is_image, scale_value
@@ -23,6 +25,13 @@ core = vs.core
 # List of containers that are better off being indexed externally
 annoying_formats = ['.iso', '.ts', '.vob']
 
+# Source filters for files that shouldn't be indexed with ffms2, looked up by extension
+source_filters: Dict[str, Callable[..., vs.VideoNode]] = {
+    '.d2v': lambda file, **index_args: core.d2v.Source(file, **index_args),
+    '.dgi': lambda file, **index_args: core.dgdecodenv.DGSource(file, **index_args),
+    '.m2ts': lambda file, **index_args: core.lsmas.LWLibavSource(file, **index_args),
+}
+
 
 def source(file: str, ref: Optional[vs.VideoNode] = None,
            force_lsmas: bool = False,
@@ -55,14 +64,15 @@ def source(file: str, ref: Optional[vs.VideoNode] = None,
     :return:                  Vapoursynth clip representing input file
     """
 
-    # TODO: find a way to NOT have to rely on a million elif's
     if file.startswith('file:///'):
-        file = file[8::]
+        file = url2pathname(urlparse(file).path)
+
+    ext = os.path.splitext(file)[1].lower()
 
     # Error handling for some file types
-    if file.endswith('.mpls') and mpls is False:
+    if ext == '.mpls' and mpls is False:
         raise ValueError("source: 'Set \"mpls = True\" and pass a path to the base Blu-ray directory for this kind of file'")  # noqa: E501
-    if os.path.splitext(file)[1].lower() in annoying_formats:
+    if ext in annoying_formats:
         raise ValueError("source: 'Use an external indexer like d2vwitch or DGIndexNV for this kind of file'")  # noqa: E501
 
     if force_lsmas:
@@ -73,17 +83,12 @@ def source(file: str, ref: Optional[vs.VideoNode] = None,
         clip = core.std.Splice([core.lsmas.LWLibavSource(mpls_in['clip'][i], **index_args)
                                 for i in range(mpls_in['count'])])
 
-    elif file.endswith('.d2v'):
-        clip = core.d2v.Source(file, **index_args)
-    elif file.endswith('.dgi'):
-        clip = core.dgdecodenv.DGSource(file, **index_args)
+    elif ext in source_filters:
+        clip = source_filters[ext](file, **index_args)
     elif is_image(file):
         clip = core.imwri.Read(file, **index_args)
     else:
-        if file.endswith('.m2ts'):
-            clip = core.lsmas.LWLibavSource(file, **index_args)
-        else:
-            clip = core.ffms2.Source(file, **index_args)
+        clip = core.ffms2.Source(file, **index_args)
 
     if ref:
         if ref.format is None:
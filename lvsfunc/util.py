@@ -1,6 +1,7 @@
 """
     Helper functions for the main functions in the script.
 """
+from functools import partial
 from typing import Any, Callable, List, Optional, Sequence, Type, TypeVar, Tuple, Union
 
 import vapoursynth as vs
@@ -18,6 +19,9 @@ def quick_resample(clip: vs.VideoNode,
     A function to quickly resample to 16/8 bit and back to the original depth.
     Useful for filters that only work in 16 bit or lower when you're working in float.
 
+    If the depth a filter needs is known up front, set it as a ``_required_depth`` attribute
+    on `function` to skip the 16 bit attempt entirely.
+
     :param clip:      Input clip
     :param function:  Filter to run after resampling (accepts and returns clip)
 
@@ -25,12 +29,17 @@ def quick_resample(clip: vs.VideoNode,
     """
     if clip.format is None:
         raise ValueError("quick_resample: 'Variable-format clips not supported'")
-    try:
-        down = depth(clip, 16)
-        filtered = function(down)
-    except:  # noqa: E722
-        down = depth(clip, 8)
-        filtered = function(down)
+
+    required_depth: Optional[int] = getattr(function, '_required_depth', None)
+
+    if required_depth is not None:
+        filtered = function(depth(clip, required_depth))
+    else:
+        try:
+            filtered = function(depth(clip, 16))
+        except vs.Error:
+            filtered = function(depth(clip, 8))
+
     return depth(filtered, clip.format.bits_per_sample)
 
 
@@ -67,6 +76,78 @@ def pick_removegrain(clip: vs.VideoNode) -> Callable[..., vs.VideoNode]:
     return core.rgvs.RemoveGrain if clip.format.bits_per_sample < 32 else core.rgsf.RemoveGrain
 
 
+def merge_chroma(luma: vs.VideoNode, ref: vs.VideoNode) -> vs.VideoNode:
+    """
+    Merges a processed luma clip back with the chroma planes of a reference clip.
+    If the reference clip is GRAY, the luma clip is returned as-is.
+
+    :param luma:    Clip to take the luma plane from
+    :param ref:     Clip to take the chroma planes from
+
+    :return:        ``luma`` with ``ref``\\'s chroma, or just ``luma`` if ``ref`` is GRAY
+    """
+    if ref.format is None:
+        raise ValueError("merge_chroma: 'Variable-format clips not supported'")
+    return luma if ref.format.color_family == vs.GRAY \
+        else core.std.ShufflePlanes([luma, ref], planes=[0, 1, 2], colorfamily=vs.YUV)
+
+
+def pick_nlmeans(clip: vs.VideoNode) -> Callable[..., vs.VideoNode]:
+    """
+    Returns the fastest available NLMeans implementation for the input clip.
+    Prefers nlm_cuda (with multiple CUDA streams), then nlm_ispc, and falls back to knlm.KNLMeansCL.
+
+    nlm_cuda and nlm_ispc only accept 32 bit float input.
+    If the clip is anything else, the returned function converts it to 32 bit float,
+    denoises it, and rounds the result back to the clip's original format without dithering.
+    Only pass parameters that KNLMeansCL also takes (d, a, s, h, channels, wmode, wref),
+    as the function you get depends on which plugins are installed.
+
+    Dependencies:
+    * vs-nlm-cuda (optional)
+    * vs-nlm-ispc (optional)
+    * KNLMeansCL (fallback)
+
+    :param clip: Input clip
+
+    :return:     NLMeans function for the input clip
+    """
+    if clip.format is None:
+        raise ValueError("pick_nlmeans: 'Variable-format clips not supported'")
+
+    nlmeans: Callable[..., vs.VideoNode]
+    if hasattr(core, 'nlm_cuda'):
+        nlmeans = partial(core.nlm_cuda.NLMeans, num_streams=4)
+    elif hasattr(core, 'nlm_ispc'):
+        nlmeans = core.nlm_ispc.NLMeans
+    else:
+        return core.knlm.KNLMeansCL
+
+    if clip.format.sample_type == vs.FLOAT and clip.format.bits_per_sample == 32:
+        return nlmeans
+
+    bits, sample_type = clip.format.bits_per_sample, clip.format.sample_type
+
+    # Round like KNLMeansCL does, as dither noise would be sharpened right back in by callers like dir_unsharp
+    def _float_nlmeans(clip: vs.VideoNode, **kwargs: Any) -> vs.VideoNode:
+        return depth(nlmeans(depth(clip, 32), **kwargs), bits, sample_type=sample_type, dither_type='none')
+
+    return _float_nlmeans
+
+
+def pick_expr() -> Callable[..., vs.VideoNode]:
+    """
+    Returns akarin.Expr if it's available, else std.Expr.
+    akarin.Expr accepts every std.Expr expression, but compiles them into faster code.
+
+    Dependencies:
+    * akarin (optional)
+
+    :return:     Fastest available Expr function
+    """
+    return core.akarin.Expr if hasattr(core, 'akarin') else core.std.Expr
+
+
 VideoProp = Union[
     int, Sequence[int],
     float, Sequence[float],
@@ -95,7 +176,8 @@ def get_prop(frame: vs.VideoFrame, key: str, t: Type[T]) -> T:
     except KeyError:
         raise KeyError(f"get_prop: 'Key {key} not present in props'")
 
-    if not isinstance(prop, t):
+    # Exact type match first, as this commonly runs for every frame inside FrameEval callbacks
+    if type(prop) is not t and not isinstance(prop, t):
         raise ValueError(f"get_prop: 'Key {key} did not contain expected type: Expected {t} got {type(prop)}'")
 
     return prop
@@ -112,6 +194,9 @@ def normalize_ranges(clip: vs.VideoNode, ranges: Union[Range, List[Range]]) -> L
     """
     ranges = ranges if isinstance(ranges, list) else [ranges]
 
+    # Looked up once, as this gets called for every replace_ranges during script evaluation
+    last_frame = clip.num_frames - 1
+
     out = []
     for r in ranges:
         if isinstance(r, tuple):
@@ -119,22 +204,47 @@ def normalize_ranges(clip: vs.VideoNode, ranges: Union[Range, List[Range]]) -> L
             if start is None:
                 start = 0
             if end is None:
-                end = clip.num_frames - 1
+                end = last_frame
         elif r is None:
-            start = clip.num_frames - 1
-            end = clip.num_frames - 1
+            start = end = last_frame
         else:
-            start = r
-            end = r
+            start = end = r
         if start < 0:
-            start = clip.num_frames - 1 + start
+            start += last_frame
         if end < 0:
-            end = clip.num_frames - 1 + end
+            end += last_frame
         out.append((start, end))
 
     return out
 
 
+def _select_frames_func(n: int, clips: Sequence[vs.VideoNode], indices: List[Tuple[int, int]]) -> vs.VideoNode:
+    clip_idx, frame_idx = indices[n]
+    return clips[clip_idx][frame_idx]
+
+
+def select_frames(clips: Sequence[vs.VideoNode], indices: List[Tuple[int, int]]) -> vs.VideoNode:
+    """
+    Build a clip by picking single frames from any of the given clips.
+    Every output frame is routed straight to its source clip through a single FrameEval,
+    rather than building a chain of Trims and Splices.
+
+    All clips are expected to share the same format and dimensions.
+
+    :param clips:   Clips to select frames from
+    :param indices: List of ``(clip_index, frame_index)`` tuples, one for every frame of the output clip
+
+    :return:        Clip with the selected frames
+    """
+    placeholder_clip = clips[0]
+    length = len(indices)
+
+    if length != placeholder_clip.num_frames:
+        placeholder_clip = core.std.BlankClip(placeholder_clip, length=length)
+
+    return core.std.FrameEval(placeholder_clip, partial(_select_frames_func, clips=clips, indices=indices))
+
+
 def replace_ranges(clip_a: vs.VideoNode,
                    clip_b: vs.VideoNode,
                    ranges: Union[Range, List[Range], None]) -> vs.VideoNode:
@@ -173,19 +283,26 @@ def replace_ranges(clip_a: vs.VideoNode,
     if ranges is None:
         return clip_a
 
-    out = clip_a
+    # Merge overlapping and adjacent ranges so every run of frames becomes a single Trim
+    merged: List[List[int]] = []
+    for start, end in sorted(normalize_ranges(clip_b, ranges)):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
 
-    nranges = normalize_ranges(clip_b, ranges)
+    segments: List[vs.VideoNode] = []
+    prev_end = -1
+    for start, end in merged:
+        if start > prev_end + 1:
+            segments.append(clip_a[prev_end + 1:start])
+        segments.append(clip_b[start:end + 1])
+        prev_end = end
 
-    for start, end in nranges:
-        tmp = clip_b[start:end + 1]
-        if start != 0:
-            tmp = out[: start] + tmp
-        if end < out.num_frames - 1:
-            tmp = tmp + out[end + 1:]
-        out = tmp
+    if prev_end < clip_a.num_frames - 1:
+        segments.append(clip_a[prev_end + 1:])
 
-    return out
+    return core.std.Splice(segments)
 
 
 def scale_thresh(thresh: float, clip: vs.VideoNode, assume: Optional[int] = None) -> float:
@@ -206,5 +323,5 @@ def scale_thresh(thresh: float, clip: vs.VideoNode, assume: Optional[int] = None
     if thresh > 1:
         return thresh if not assume \
             else round(thresh/((1 << assume) - 1) * ((1 << clip.format.bits_per_sample) - 1))
-    return thresh if clip.format.sample_type == vs.FLOAT or thresh > 1 \
+    return thresh if clip.format.sample_type == vs.FLOAT \
         else round(thresh * ((1 << clip.format.bits_per_sample) - 1))
@@ -374,6 +374,26 @@ class _Plugin_adg_Bound(Plugin):
 # end implementation
 
 
+# implementation: akarin
+class _Plugin_akarin_Unbound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def Expr(self, clips: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]], format: typing.Optional[int] = None, opt: typing.Optional[int] = None, boundary: typing.Optional[int] = None) -> "VideoNode": ...
+    def Select(self, clip_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], prop_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]]) -> "VideoNode": ...
+
+
+class _Plugin_akarin_Bound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def Expr(self, expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]], format: typing.Optional[int] = None, opt: typing.Optional[int] = None, boundary: typing.Optional[int] = None) -> "VideoNode": ...
+    def Select(self, prop_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]]) -> "VideoNode": ...
+# end implementation
+
+
 # implementation: bilateral
 class _Plugin_bilateral_Unbound(Plugin):
     """
@@ -1053,6 +1073,42 @@ class _Plugin_neo_f3kdb_Bound(Plugin):
 # end implementation
 
 
+# implementation: nlm_cuda
+class _Plugin_nlm_cuda_Unbound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def NLMeans(self, clip: "VideoNode", d: typing.Optional[int] = None, a: typing.Optional[int] = None, s: typing.Optional[int] = None, h: typing.Optional[float] = None, channels: typing.Union[str, bytes, bytearray, None] = None, wmode: typing.Optional[int] = None, wref: typing.Optional[float] = None, rclip: typing.Optional["VideoNode"] = None, device_id: typing.Optional[int] = None, num_streams: typing.Optional[int] = None) -> "VideoNode": ...
+
+
+class _Plugin_nlm_cuda_Bound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def NLMeans(self, d: typing.Optional[int] = None, a: typing.Optional[int] = None, s: typing.Optional[int] = None, h: typing.Optional[float] = None, channels: typing.Union[str, bytes, bytearray, None] = None, wmode: typing.Optional[int] = None, wref: typing.Optional[float] = None, rclip: typing.Optional["VideoNode"] = None, device_id: typing.Optional[int] = None, num_streams: typing.Optional[int] = None) -> "VideoNode": ...
+# end implementation
+
+
+# implementation: nlm_ispc
+class _Plugin_nlm_ispc_Unbound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def NLMeans(self, clip: "VideoNode", d: typing.Optional[int] = None, a: typing.Optional[int] = None, s: typing.Optional[int] = None, h: typing.Optional[float] = None, channels: typing.Union[str, bytes, bytearray, None] = None, wmode: typing.Optional[int] = None, wref: typing.Optional[float] = None, rclip: typing.Optional["VideoNode"] = None) -> "VideoNode": ...
+
+
+class _Plugin_nlm_ispc_Bound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def NLMeans(self, d: typing.Optional[int] = None, a: typing.Optional[int] = None, s: typing.Optional[int] = None, h: typing.Optional[float] = None, channels: typing.Union[str, bytes, bytearray, None] = None, wmode: typing.Optional[int] = None, wref: typing.Optional[float] = None, rclip: typing.Optional["VideoNode"] = None) -> "VideoNode": ...
+# end implementation
+
+
 # implementation: nnedi3
 class _Plugin_nnedi3_Unbound(Plugin):
     """
@@ -1707,6 +1763,13 @@ class VideoNode:
         Adaptive grain
         """
 # end instance
+# instance_bound: akarin
+    @property
+    def akarin(self) -> _Plugin_akarin_Bound:
+        """
+        Akarin's Experimental Filters
+        """
+# end instance
 # instance_bound: bilateral
     @property
     def bilateral(self) -> _Plugin_bilateral_Bound:
@@ -1924,6 +1987,20 @@ class VideoNode:
         Neo f3kdb
         """
 # end instance
+# instance_bound: nlm_cuda
+    @property
+    def nlm_cuda(self) -> _Plugin_nlm_cuda_Bound:
+        """
+        Non-local means denoise filter implemented in CUDA
+        """
+# end instance
+# instance_bound: nlm_ispc
+    @property
+    def nlm_ispc(self) -> _Plugin_nlm_ispc_Bound:
+        """
+        Non-local means denoise filter implemented in ISPC
+        """
+# end instance
 # instance_bound: nnedi3
     @property
     def nnedi3(self) -> _Plugin_nnedi3_Bound:
@@ -2149,6 +2226,13 @@ class Core:
         Adaptive grain
         """
 # end instance
+# instance_unbound: akarin
+    @property
+    def akarin(self) -> _Plugin_akarin_Unbound:
+        """
+        Akarin's Experimental Filters
+        """
+# end instance
 # instance_unbound: bilateral
     @property
     def bilateral(self) -> _Plugin_bilateral_Unbound:
@@ -2366,6 +2450,20 @@ class Core:
         Neo f3kdb
         """
 # end instance
+# instance_unbound: nlm_cuda
+    @property
+    def nlm_cuda(self) -> _Plugin_nlm_cuda_Unbound:
+        """
+        Non-local means denoise filter implemented in CUDA
+        """
+# end instance
+# instance_unbound: nlm_ispc
+    @property
+    def nlm_ispc(self) -> _Plugin_nlm_ispc_Unbound:
+        """
+        Non-local means denoise filter implemented in ISPC
+        """
+# end instance
 # instance_unbound: nnedi3
     @property
     def nnedi3(self) -> _Plugin_nnedi3_Unbound: